@@ -0,0 +1,65 @@
+"""
+Life Progress Core
+Shared helpers used by life_progress.py and life_progress_bar.py
+"""
+
+import bisect
+import re
+
+# Plain whole numbers like "25" (surrounding spaces allowed)
+_INT_RE = re.compile(r"\s*(\d+)\s*")
+
+def validate_age(age_str, is_lifespan=False):
+    """
+    Validate age input
+    Returns: (is_valid, error_message, age_int)
+    """
+    if not age_str:
+        return False, "Input cannot be empty.", 0
+
+    # Fast path: whole numbers skip the float round-trip
+    match = _INT_RE.fullmatch(age_str)
+    if match:
+        age_int = int(match.group(1))
+    else:
+        try:
+            age = float(age_str)
+        except ValueError:
+            return False, "Please enter a valid number.", 0
+
+        # Check if it's a whole number (for age)
+        if not is_lifespan and age != int(age):
+            return False, "Age should be a whole number (e.g., 25).", 0
+
+        age_int = int(age) if not is_lifespan else age
+
+    if age_int <= 0:
+        return False, "Please enter a positive number.", 0
+
+    if is_lifespan and age_int < 10:
+        return False, "Lifespan should be at least 10 years.", 0
+
+    if not is_lifespan and age_int > 150:
+        return False, "Please enter a realistic age (max 150).", 0
+
+    return True, "", age_int
+
+def calculate_percentage(age, lifespan):
+    """Calculate percentage of life lived"""
+    # Clamp before dividing so the result is already capped at 100%
+    return min(age, lifespan) * 100 / lifespan
+
+def split_bar(percentage, bar_length):
+    """
+    Work out how many cells of the bar are filled
+    Returns: (filled_length, empty_length)
+    """
+    filled_length = int(round(bar_length * percentage / 100))
+    return filled_length, bar_length - filled_length
+
+def lookup(limits, values, key):
+    """
+    Pick the value for the first limit that key is below
+    values needs one more entry than limits (for keys past the last limit)
+    """
+    return values[bisect.bisect_right(limits, key)]
@@ -3,192 +3,295 @@ Life Progress Bar Generator
 A terminal-based tool to visualize your life progress
 """
 
-import time
+from functools import lru_cache
 import sys
 
-def validate_age(age_str, is_lifespan=False):
+from _life_core import validate_age, calculate_percentage, split_bar, lookup
+
+# Animation settings
+ANIMATE = True         # Set to False to draw the final bar straight away
+ANIMATION_TIME = 0.3   # Total seconds the animation may take
+MAX_FRAMES = 20        # Most frames drawn in one animation
+
+# Separator lines, built once
+_SEP_EQ = "=" * 60
+_SEP_DASH = "-" * 60
+_SEP_STAR = "✨" * 30
+_SEP_FILE = "=" * 50  # Narrower rule used in saved reports
+
+# Full-length bar pieces, built once and sliced for each bar
+_BAR_MAX = 80  # Longest bar drawn by slicing; longer bars are built by repetition
+_FILLED_TEMPLATE = "█" * _BAR_MAX
+_EMPTY_TEMPLATE = "─" * _BAR_MAX
+
+# Bar colors (ANSI escape codes): green, yellow, orange, red
+_COLOR_FOR_BUCKET = ("\033[92m", "\033[93m", "\033[33m", "\033[91m")
+_RESET = "\033[0m"
+
+# Color for every whole percentage 0-100 (clamped): below 30, 60, 80 and the rest
+_COLOR_LUT = tuple(
+    _COLOR_FOR_BUCKET[0 if i < 30 else 1 if i < 60 else 2 if i < 80 else 3]
+    for i in range(101)
+)
+
+def _compute_fill(percentage, bar_length=40):
     """
-    Validate age input
-    Returns: (is_valid, error_message, age_int)
+    Work out how the bar is split
+    Returns: (filled_length, empty_length, color)
     """
-    if not age_str:
-        return False, "Input cannot be empty.", 0
-    
-    try:
-        age = float(age_str)
-    except ValueError:
-        return False, "Please enter a valid number.", 0
-    
-    # Check if it's a whole number (for age)
-    if not is_lifespan and age != int(age):
-        return False, "Age should be a whole number (e.g., 25).", 0
+    filled_length, empty_length = split_bar(percentage, bar_length)
     
-    age_int = int(age) if not is_lifespan else age
-    
-    if age_int <= 0:
-        return False, "Please enter a positive number.", 0
-    
-    if is_lifespan and age_int < 10:
-        return False, "Lifespan should be at least 10 years.", 0
-    
-    if not is_lifespan and age_int > 150:
-        return False, "Please enter a realistic age (max 150).", 0
-    
-    return True, "", age_int
+    # Pick color based on percentage
+    return filled_length, empty_length, _COLOR_LUT[max(0, min(int(percentage), 100))]
 
-def calculate_percentage(age, lifespan):
-    """Calculate percentage of life lived"""
-    return min((age / lifespan) * 100, 100)  # Cap at 100%
+def _bar_cells(filled_length, empty_length):
+    """
+    Filled and empty parts of the bar
+    Sliced from the templates when they fit, built by repetition otherwise
+    (a negative count, from a percentage outside 0-100, can't be sliced)
+    """
+    if 0 <= filled_length <= _BAR_MAX and 0 <= empty_length <= _BAR_MAX - filled_length:
+        return _FILLED_TEMPLATE[:filled_length], _EMPTY_TEMPLATE[:empty_length]
+    return "█" * filled_length, "─" * empty_length
 
 def create_progress_bar(percentage, bar_length=40):
     """
     Create ASCII progress bar
     Example: [███████-------------] 35%
     """
-    filled_length = int(round(bar_length * percentage / 100))
-    empty_length = bar_length - filled_length
-    
-    # Create bar with blocks and dashes
-    bar = "█" * filled_length + "─" * empty_length
-    
-    # Add color based on percentage (ANSI escape codes)
-    if percentage < 30:
-        color = "\033[92m"  # Green
-    elif percentage < 60:
-        color = "\033[93m"  # Yellow
-    elif percentage < 80:
-        color = "\033[33m"  # Orange
-    else:
-        color = "\033[91m"  # Red
+    filled_length, empty_length, color = _compute_fill(percentage, bar_length)
+    filled, empty = _bar_cells(filled_length, empty_length)
     
-    reset_color = "\033[0m"
-    
-    return f"[{color}{bar}{reset_color}]"
+    # Create bar with blocks and dashes, joined in a single pass
+    return "".join(("[", color, filled, empty, _RESET, "]"))
+
+def _render_bar_plain(percentage, bar_length=40):
+    """Create the progress bar without any color codes (for files)"""
+    filled_length, empty_length, _ = _compute_fill(percentage, bar_length)
+    filled, empty = _bar_cells(filled_length, empty_length)
+    return "".join(("[", filled, empty, "]"))
+
+# Life stages: an age below _STAGE_LIMITS[i] falls in _STAGE_NAMES[i]
+_STAGE_LIMITS = (13, 20, 30, 40, 50, 65)
+_STAGE_NAMES = (
+    "Childhood 👶",
+    "Teen Years 🧒",
+    "Twenties 🌟",
+    "Thirties 💼",
+    "Forties 🏡",
+    "Fifties 🎯",
+    "Golden Years 👴",
+)
 
+@lru_cache(maxsize=None)
 def get_life_stage(age):
     """Determine life stage based on age"""
-    if age < 13:
-        return "Childhood 👶"
-    elif age < 20:
-        return "Teen Years 🧒"
-    elif age < 30:
-        return "Twenties 🌟"
-    elif age < 40:
-        return "Thirties 💼"
-    elif age < 50:
-        return "Forties 🏡"
-    elif age < 65:
-        return "Fifties 🎯"
-    else:
-        return "Golden Years 👴"
+    return lookup(_STAGE_LIMITS, _STAGE_NAMES, age)
+
+# Messages for each stretch of life, shared by every call
+_MSG_BEGIN = (
+    "🌟 Your adventure is just beginning!",
+    "The whole world is ahead of you.",
+    "Every day is a blank page to write your story."
+)
+_MSG_BUILD = (
+    "🚀 You're building momentum!",
+    "This is where foundations are strengthened.",
+    "Your experiences are shaping who you'll become."
+)
+_MSG_PRIME = (
+    "💪 You're in your prime!",
+    "This is your time to make a real impact.",
+    "Use your wisdom to guide your energy."
+)
+_MSG_PERSPECTIVE = (
+    "🎯 You've gained valuable perspective!",
+    "Your experience is your superpower.",
+    "Now you know what truly matters."
+)
+_MSG_WISDOM = (
+    "👑 You are a treasure of wisdom!",
+    "Every moment is precious and earned.",
+    "Your legacy is being written every day."
+)
+
+# A percentage below _MSG_LIMITS[i] gets _MESSAGES[i]
+_MSG_LIMITS = (20, 40, 60, 80)
+_MESSAGES = (_MSG_BEGIN, _MSG_BUILD, _MSG_PRIME, _MSG_PERSPECTIVE, _MSG_WISDOM)
 
 def get_motivational_message(percentage):
     """Get motivational message based on life percentage"""
-    if percentage < 20:
-        return [
-            "🌟 Your adventure is just beginning!",
-            "The whole world is ahead of you.",
-            "Every day is a blank page to write your story."
-        ]
-    elif percentage < 40:
-        return [
-            "🚀 You're building momentum!",
-            "This is where foundations are strengthened.",
-            "Your experiences are shaping who you'll become."
-        ]
-    elif percentage < 60:
-        return [
-            "💪 You're in your prime!",
-            "This is your time to make a real impact.",
-            "Use your wisdom to guide your energy."
-        ]
-    elif percentage < 80:
-        return [
-            "🎯 You've gained valuable perspective!",
-            "Your experience is your superpower.",
-            "Now you know what truly matters."
-        ]
-    else:
-        return [
-            "👑 You are a treasure of wisdom!",
-            "Every moment is precious and earned.",
-            "Your legacy is being written every day."
-        ]
+    return lookup(_MSG_LIMITS, _MESSAGES, percentage)
+
+# Fixed report text, built once and reused for every report
+_REPORT_TITLE = "📈 YOUR LIFE PROGRESS REPORT"
+_AGE_PFX = "📅 Age: "
+_LIFESPAN_PFX = "🎯 Assumed Lifespan: "
+_STAGE_PFX = "🏷️  Life Stage: "
+_PERCENT_PFX = "📊 Percentage Lived: "
+_REFLECTION_TITLE = "💭 REFLECTION:"
+_BULLET = "  • "
+_YEARS_AHEAD_PFX = "\n⏳ You have approximately "
+_DAYS_AHEAD_PFX = "   That's about "
+
+# The whole screen report as one template, filled in by display_results()
+_REPORT_TMPL = (
+    "\n" + _SEP_EQ + "\n"
+    + _REPORT_TITLE + "\n"
+    + _SEP_EQ + "\n"
+    + "\n" + _AGE_PFX + "{age} years\n"
+    + _LIFESPAN_PFX + "{lifespan} years\n"
+    + _STAGE_PFX + "{stage}\n"
+    + _PERCENT_PFX + "{percent}\n"
+    + "\n{bar} {percent}\n\n"
+    + _REFLECTION_TITLE + "\n"
+    + "{messages}\n"
+    + "{time_left}"
+    + "\n" + _SEP_EQ + "\n"
+)
+
+@lru_cache(maxsize=256)
+def _build_report(age, lifespan):
+    """
+    Work out the figures shared by the screen and file reports
+    Returns: (percentage, percent_text, years_left, days_left)
+    years_left and days_left are None at 100%
+    """
+    percentage = calculate_percentage(age, lifespan)
+    if percentage >= 100:
+        return percentage, f"{percentage:.1f}%", None, None
+    
+    years_left = lifespan - age
+    return percentage, f"{percentage:.1f}%", years_left, years_left * 365
 
 def display_header():
     """Display project header"""
-    print("\n" + "="*60)
-    print(" " * 15 + "🌈 LIFE PROGRESS BAR GENERATOR")
-    print("="*60)
-    print("\nA visual representation of your life journey")
-    print("Remember: This is just a tool, not a destiny predictor!")
-    print("-"*60)
+    lines = [
+        "\n" + _SEP_EQ,
+        " " * 15 + "🌈 LIFE PROGRESS BAR GENERATOR",
+        _SEP_EQ,
+        "\nA visual representation of your life journey",
+        "Remember: This is just a tool, not a destiny predictor!",
+        _SEP_DASH,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def animate_progress(percentage, bar_length=40):
     """Animate the progress bar filling up"""
     print("\n📊 Generating your life progress bar...")
-    
-    for i in range(0, int(percentage) + 1, 2):  # Animate in steps of 2%
-        current_percentage = min(i, percentage)
-        bar = create_progress_bar(current_percentage, bar_length)
-        sys.stdout.write(f"\rProgress: {bar} {current_percentage:.1f}%")
-        sys.stdout.flush()
-        time.sleep(0.05)
-    
+
+    # Roughly one frame per 2%, capped so the whole animation stays short
+    n_frames = min(MAX_FRAMES, int(percentage / 2) + 1) if ANIMATE else 1
+    delay = ANIMATION_TIME / n_frames if ANIMATE else 0
+
+    # Screen columns (1-based) of the first bar cell and of the percentage
+    bar_col = len("Progress: [") + 1
+    percent_col = bar_col + bar_length + 2
+
+    # Build every frame up front so the loop only writes and sleeps.
+    # Within one color band the bar only grows, so a frame just draws the
+    # new cells and the new percentage; a color change redraws the line.
+    frames = []
+    drawn_filled, drawn_color = 0, None
+    for step in range(1, n_frames + 1):
+        current_percentage = percentage * step / n_frames
+        filled_length, _, color = _compute_fill(current_percentage, bar_length)
+
+        if color != drawn_color:
+            bar = create_progress_bar(current_percentage, bar_length)
+            frames.append(f"\rProgress: {bar} {current_percentage:.1f}%")
+        else:
+            new_cells = ""
+            if filled_length > drawn_filled:
+                new_cells = "".join((
+                    f"\033[{bar_col + drawn_filled}G", color,
+                    _bar_cells(filled_length - drawn_filled, 0)[0], _RESET,
+                ))
+            frames.append(f"{new_cells}\033[{percent_col}G{current_percentage:.1f}%\033[K")
+
+        drawn_filled, drawn_color = filled_length, color
+
+    # Encode the frames once and write the bytes straight to the terminal
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is None:
+        stream = sys.stdout  # No byte stream underneath (e.g. an IDE console)
+    else:
+        # Match the text layer's encoding and error handler
+        encoding = sys.stdout.encoding or "utf-8"
+        errors = sys.stdout.errors or "strict"
+        frames = [frame.encode(encoding, errors) for frame in frames]
+        sys.stdout.flush()  # Make sure the heading is out before the raw bytes
+
+    write = stream.write
+    flush = stream.flush
+    if not delay:
+        # Nothing to sleep between, so time is never imported
+        for frame in frames:
+            write(frame)
+        flush()
+        print()  # New line after the bar
+        return
+
+    import time  # Only needed when animating, so load it lazily
+
+    for frame in frames:
+        write(frame)
+        flush()  # One flush per frame so it shows up before the sleep
+        time.sleep(delay)
+
     print()  # New line after animation
 
-def display_results(age, lifespan, percentage, life_stage, messages):
-    """Display all results in a clean format"""
-    print("\n" + "="*60)
-    print("📈 YOUR LIFE PROGRESS REPORT")
-    print("="*60)
-    
-    print(f"\n📅 Age: {age} years")
-    print(f"🎯 Assumed Lifespan: {lifespan} years")
-    print(f"🏷️  Life Stage: {life_stage}")
-    print(f"📊 Percentage Lived: {percentage:.1f}%")
-    
+def display_results(age, lifespan, report, life_stage, messages):
+    """Display all results in a clean format (report comes from _build_report)"""
+    percentage, percent_text, years_left, days_left = report
     bar = create_progress_bar(percentage)
-    print(f"\n{bar} {percentage:.1f}%\n")
-    
-    print("💭 REFLECTION:")
-    for message in messages:
-        print(f"  • {message}")
     
     # Display time left
-    if percentage < 100:
-        years_left = lifespan - age
-        print(f"\n⏳ You have approximately {years_left} years ahead!")
-        print(f"   That's about {years_left * 365:,} more days to make count!")
+    time_left = ""
+    if years_left is not None:
+        time_left = (
+            f"{_YEARS_AHEAD_PFX}{years_left} years ahead!\n"
+            f"{_DAYS_AHEAD_PFX}{days_left:,} more days to make count!\n"
+        )
     
-    print("\n" + "="*60)
+    # Fill in the template and write the report in one go
+    sys.stdout.write(_REPORT_TMPL.format_map({
+        "age": age,
+        "lifespan": lifespan,
+        "stage": life_stage,
+        "percent": percent_text,
+        "bar": bar,
+        "messages": "\n".join(_BULLET + message for message in messages),
+        "time_left": time_left,
+    }))
 
-def save_to_file(age, lifespan, percentage, life_stage):
-    """Save results to a text file"""
+def save_to_file(age, lifespan, report, life_stage):
+    """Save results to a text file (report comes from _build_report)"""
     try:
         filename = f"life_progress_{age}.txt"
-        with open(filename, 'w') as file:
-            file.write("="*50 + "\n")
-            file.write("       LIFE PROGRESS REPORT\n")
-            file.write("="*50 + "\n\n")
-            file.write(f"Age: {age} years\n")
-            file.write(f"Lifespan: {lifespan} years\n")
-            file.write(f"Life Stage: {life_stage}\n")
-            file.write(f"Percentage Lived: {percentage:.1f}%\n\n")
-            
-            bar = create_progress_bar(percentage).replace("\033[92m", "")\
-                                                .replace("\033[93m", "")\
-                                                .replace("\033[33m", "")\
-                                                .replace("\033[91m", "")\
-                                                .replace("\033[0m", "")
-            file.write(f"{bar} {percentage:.1f}%\n")
-            
-            if percentage < 100:
-                years_left = lifespan - age
-                file.write(f"\nYou have {years_left} years and {years_left * 365} days ahead!\n")
-            
-            file.write("\nRemember: Every day is a new opportunity!\n")
-            file.write("="*50)
+        percentage, percent_text, years_left, days_left = report
+        bar = _render_bar_plain(percentage)
+        lines = [
+            _SEP_FILE,
+            "       LIFE PROGRESS REPORT",
+            _SEP_FILE + "\n",
+            f"Age: {age} years",
+            f"Lifespan: {lifespan} years",
+            f"Life Stage: {life_stage}",
+            f"Percentage Lived: {percent_text}\n",
+            f"{bar} {percent_text}",
+        ]
+        
+        if years_left is not None:
+            lines.append(f"\nYou have {years_left} years and {days_left} days ahead!")
+        
+        lines.append("\nRemember: Every day is a new opportunity!")
+        lines.append(_SEP_FILE)
+        
+        # Encode the whole report once and write the bytes directly
+        report = "\n".join(lines).encode("utf-8")
+        with open(filename, 'wb') as file:
+            file.write(report)
         
         print(f"\n💾 Results saved to '{filename}'")
         return True
@@ -196,6 +299,24 @@ def save_to_file(age, lifespan, percentage, life_stage):
         print(f"\n⚠️  Could not save file: {e}")
         return False
 
+def prompt_age(prompt, *, is_lifespan=False, age=None):
+    """
+    Ask until validate_age accepts the answer
+    For a lifespan, age is the current age it has to be greater than
+    """
+    while True:
+        is_valid, error_msg, value = validate_age(input(prompt), is_lifespan)
+        
+        if not is_valid:
+            if is_lifespan:
+                print(f"❌ {error_msg}")
+            else:
+                print(f"❌ {error_msg} Please try again.")
+        elif is_lifespan and value <= age:
+            print("⚠️  Lifespan should be greater than your current age. Try again.")
+        else:
+            return value
+
 def main():
     """Main function - runs the entire program"""
     
@@ -203,38 +324,22 @@ def main():
     display_header()
     
     # Get user's age
-    while True:
-        age_input = input("\n🎂 How old are you? ")
-        is_valid, error_msg, age = validate_age(age_input)
-        
-        if is_valid:
-            break
-        else:
-            print(f"❌ {error_msg} Please try again.")
+    age = prompt_age("\n🎂 How old are you? ")
     
     # Ask for custom lifespan
-    print("\n" + "-"*60)
+    print("\n" + _SEP_DASH)
     print("💡 By default, we use 80 years as average lifespan.")
     use_default = input("Would you like to use a different lifespan? (y/n): ").lower()
     
     if use_default == 'y':
-        while True:
-            lifespan_input = input("Enter your expected lifespan (years): ")
-            is_valid, error_msg, lifespan = validate_age(lifespan_input, is_lifespan=True)
-            
-            if is_valid:
-                if lifespan <= age:
-                    print("⚠️  Lifespan should be greater than your current age. Try again.")
-                else:
-                    break
-            else:
-                print(f"❌ {error_msg}")
+        lifespan = prompt_age("Enter your expected lifespan (years): ", is_lifespan=True, age=age)
     else:
         lifespan = 80
         print(f"Using default lifespan: {lifespan} years")
     
-    # Calculate percentage
-    percentage = calculate_percentage(age, lifespan)
+    # Calculate percentage and the other report figures once
+    report = _build_report(age, lifespan)
+    percentage = report[0]
     
     # Get life stage and messages
     life_stage = get_life_stage(age)
@@ -244,19 +349,19 @@ def main():
     animate_progress(percentage)
     
     # Display results
-    display_results(age, lifespan, percentage, life_stage, messages)
+    display_results(age, lifespan, report, life_stage, messages)
     
     # Ask to save results
     save_option = input("\n💾 Would you like to save these results to a file? (y/n): ").lower()
     if save_option == 'y':
-        save_to_file(age, lifespan, percentage, life_stage)
+        save_to_file(age, lifespan, report, life_stage)
     
     # Final message
-    print("\n" + "✨" * 30)
+    print("\n" + _SEP_STAR)
     print("Thank you for using the Life Progress Bar Generator!")
     print("Remember: It's not about the years in your life,")
     print("          but the life in your years! 🌟")
-    print("✨" * 30 + "\n")
+    print(_SEP_STAR + "\n")
 
 # Run the program
 if __name__ == "__main__":
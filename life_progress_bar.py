@@ -1,8 +1,11 @@
 # life_progress_bar.py
 # A beginner-friendly Python project to visualize life progress with an aesthetic terminal bar.
 
+from functools import lru_cache
 import sys
 
+from _life_core import calculate_percentage, split_bar, lookup
+
 # --- CONFIGURATION ---
 DEFAULT_LIFESPAN = 80  # Default assumed average lifespan in years
 BAR_LENGTH = 50        # Length of the progress bar in characters
@@ -16,6 +19,14 @@ COLOR_RESET = "\033[0m"   # Reset color
 CHAR_FILLED = "█"
 CHAR_EMPTY = "░"
 
+# Separator lines
+SEP_EQ = "=" * 60
+SEP_DASH = "-" * 60
+
+# Full-length bars, built once and sliced in generate_progress_bar()
+FILLED_BAR = CHAR_FILLED * BAR_LENGTH
+EMPTY_BAR = CHAR_EMPTY * BAR_LENGTH
+
 # --- CORE FUNCTIONS ---
 
 def get_valid_input(prompt, default_value=None):
@@ -55,11 +66,8 @@ def calculate_progress(age, lifespan):
     """
     Calculates the percentage of life lived and the remaining percentage.
     """
-    # Ensure age does not exceed lifespan for calculation purposes
-    age_clamped = min(age, lifespan)
-    
-    # Calculate the percentage of life lived
-    percentage_lived = (age_clamped / lifespan) * 100
+    # Calculate the percentage of life lived (capped at 100%)
+    percentage_lived = calculate_percentage(age, lifespan)
     
     # Calculate the percentage remaining
     percentage_remaining = 100 - percentage_lived
@@ -70,55 +78,60 @@ def generate_progress_bar(percentage):
     """
     Creates the aesthetic ASCII progress bar string with color.
     """
-    # Calculate the number of filled characters
-    filled_chars = int(round((percentage / 100) * BAR_LENGTH))
+    # Calculate the number of filled and empty characters
+    filled_chars, empty_chars = split_bar(percentage, BAR_LENGTH)
     
-    # Calculate the number of empty characters
-    empty_chars = BAR_LENGTH - filled_chars
+    # Slice the prebuilt bars; a percentage outside 0-100 gives a count
+    # that can't be sliced, so repeat the characters for those instead
+    if 0 <= filled_chars <= BAR_LENGTH:
+        filled, empty = FILLED_BAR[:filled_chars], EMPTY_BAR[:empty_chars]
+    else:
+        filled, empty = CHAR_FILLED * filled_chars, CHAR_EMPTY * empty_chars
     
     # Create the bar string with colors
-    bar = (
-        COLOR_GREEN + (CHAR_FILLED * filled_chars) + COLOR_RESET +
-        COLOR_GRAY + (CHAR_EMPTY * empty_chars) + COLOR_RESET
-    )
+    bar = "".join((
+        COLOR_GREEN, filled, COLOR_RESET,
+        COLOR_GRAY, empty, COLOR_RESET,
+    ))
     
     return bar
 
 # --- ENHANCEMENT FUNCTIONS (Optional but implemented) ---
 
+# Life stages: an age below STAGE_LIMITS[i] falls in STAGE_NAMES[i]
+STAGE_LIMITS = (13, 20, 40, 65, 80)
+STAGE_NAMES = (
+    "Childhood",
+    "Teenage Years",
+    "Young Adulthood",
+    "Middle Age",
+    "Elder Adulthood",
+    "Golden Years",
+)
+
+@lru_cache(maxsize=None)
 def get_life_stage(age):
     """
     Provides a simple categorization of the user's life stage.
     """
-    if age < 13:
-        return "Childhood"
-    elif age < 20:
-        return "Teenage Years"
-    elif age < 40:
-        return "Young Adulthood"
-    elif age < 65:
-        return "Middle Age"
-    elif age < 80:
-        return "Elder Adulthood"
-    else:
-        return "Golden Years"
+    return lookup(STAGE_LIMITS, STAGE_NAMES, age)
+
+# Messages: a percentage below MESSAGE_LIMITS[i] gets MESSAGES[i]
+MESSAGE_LIMITS = (15, 35, 50, 75, 100)
+MESSAGES = (
+    "The journey has just begun! Every day is a new adventure.",
+    "You're building the foundation of your life. Keep learning and growing!",
+    "Halfway to the default finish line! Time to reflect and set new goals.",
+    "You have a wealth of experience. Share your wisdom and enjoy the ride.",
+    "Every moment is precious. Focus on what truly matters.",
+    "A life well-lived! Celebrate your legacy and the moments that remain.",
+)
 
 def get_motivational_message(percentage):
     """
     Provides a motivational or reflective message based on life progress.
     """
-    if percentage < 15:
-        return "The journey has just begun! Every day is a new adventure."
-    elif percentage < 35:
-        return "You're building the foundation of your life. Keep learning and growing!"
-    elif percentage < 50:
-        return "Halfway to the default finish line! Time to reflect and set new goals."
-    elif percentage < 75:
-        return "You have a wealth of experience. Share your wisdom and enjoy the ride."
-    elif percentage < 100:
-        return "Every moment is precious. Focus on what truly matters."
-    else:
-        return "A life well-lived! Celebrate your legacy and the moments that remain."
+    return lookup(MESSAGE_LIMITS, MESSAGES, percentage)
 
 # --- DISPLAY FUNCTION ---
 
@@ -131,22 +144,26 @@ def display_results(age, lifespan, percentage_lived, percentage_remaining, bar):
     life_stage = get_life_stage(age)
     message = get_motivational_message(percentage_lived)
     
-    print("\n" + "="*60)
-    print(f"{COLOR_GREEN}✨ LIFE PROGRESS BAR GENERATOR ✨{COLOR_RESET}".center(68))
-    print("="*60 + "\n")
-    
-    print(f"👤 Your Age: {age} years")
-    print(f"🎯 Assumed Lifespan: {lifespan} years")
-    print(f"🗓️ Life Stage: {life_stage}\n")
-    
-    # Display the progress bar and percentage
-    print(f"Progress: {percentage_lived:.2f}% Lived | {percentage_remaining:.2f}% Remaining")
-    print(f"[{bar}]")
-    
-    # Display the motivational message
-    print("\n" + "-"*60)
-    print(f"💡 Reflection: {message}")
-    print("-"*60 + "\n")
+    # Build the whole report, then print it with a single write
+    lines = [
+        "\n" + SEP_EQ,
+        f"{COLOR_GREEN}✨ LIFE PROGRESS BAR GENERATOR ✨{COLOR_RESET}".center(68),
+        SEP_EQ + "\n",
+        
+        f"👤 Your Age: {age} years",
+        f"🎯 Assumed Lifespan: {lifespan} years",
+        f"🗓️ Life Stage: {life_stage}\n",
+        
+        # Display the progress bar and percentage
+        f"Progress: {percentage_lived:.2f}% Lived | {percentage_remaining:.2f}% Remaining",
+        f"[{bar}]",
+        
+        # Display the motivational message
+        "\n" + SEP_DASH,
+        f"💡 Reflection: {message}",
+        SEP_DASH + "\n",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # --- MAIN EXECUTION ---